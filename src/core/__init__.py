@@ -1,4 +1,10 @@
 from .equation_solver import EquationSolver
 from .expression_parser import ExpressionParser
+from .implicit_solver import ImplicitSolver
+from .decimation import decimate_minmax
+from .figure_renderer import FigureRenderer, render_batch
+from .solve_history import SolveHistory
 
-__all__ = ['EquationSolver', 'ExpressionParser']
\ No newline at end of file
+__all__ = ['EquationSolver', 'ExpressionParser', 'ImplicitSolver',
+           'decimate_minmax', 'FigureRenderer', 'render_batch',
+           'SolveHistory']
\ No newline at end of file
@@ -0,0 +1,59 @@
+# src/core/decimation.py
+import numpy as np
+
+
+def minmax_indices(y_vals, n_bins):
+    """
+    Return the sample indices kept by min-max decimation of y_vals.
+
+    The samples are split into n_bins consecutive columns and the indices
+    of the minimum and maximum of each column are kept, in order. Columns
+    that are entirely NaN keep their first index so gaps are preserved.
+    """
+    y_vals = np.asarray(y_vals, dtype=float)
+    n = len(y_vals)
+    n_bins = int(n_bins)
+
+    if n_bins < 1 or n <= 2 * n_bins:
+        return np.arange(n)
+
+    # Split into n_bins columns with edges from linspace so every column
+    # holds real samples; pad rows to the widest column with NaN
+    edges = np.linspace(0, n, n_bins + 1).astype(int)
+    starts = edges[:-1]
+    sizes = np.diff(edges)
+    per_bin = sizes.max()
+    if sizes.min() == per_bin:
+        grid = y_vals.reshape(n_bins, per_bin)
+    else:
+        offsets = np.arange(per_bin)
+        grid_idx = np.minimum(starts[:, None] + offsets, n - 1)
+        grid = np.where(offsets < sizes[:, None], y_vals[grid_idx], np.nan)
+
+    nan_mask = np.isnan(grid)
+    empty = nan_mask.all(axis=1)
+    lo = np.where(nan_mask, np.inf, grid).argmin(axis=1)
+    hi = np.where(nan_mask, -np.inf, grid).argmax(axis=1)
+
+    first = starts + np.minimum(lo, hi)
+    second = starts + np.maximum(lo, hi)
+
+    # Interleave (first, second) per column, dropping the duplicate when
+    # a column is flat, holds a single valid sample or is all NaN
+    idx = np.column_stack((first, second)).ravel()
+    keep = np.column_stack((np.ones(n_bins, dtype=bool),
+                            ~empty & (second != first))).ravel()
+    return idx[keep]
+
+
+def decimate_minmax(x_vals, y_vals, n_bins):
+    """
+    Reduce a curve to at most two points per pixel column.
+
+    Only the minimum and maximum of each column are kept, so peaks and
+    asymptotes survive; see minmax_indices.
+    """
+    x_vals = np.asarray(x_vals, dtype=float)
+    y_vals = np.asarray(y_vals, dtype=float)
+    idx = minmax_indices(y_vals, n_bins)
+    return x_vals[idx], y_vals[idx]
@@ -1,11 +1,111 @@
 # src/core/equation_solver.py
 import numpy as np
-from sympy import symbols, sympify, solve, log
+from sympy import symbols, sympify, solve, log, lambdify, diff, Poly, PolynomialError
 from .expression_parser import ExpressionParser
 import re
+
+# Numeric literals that are not exponents; these are the coefficients a
+# small edit is allowed to change without a new symbolic solve
+COEFFICIENT_PATTERN = re.compile(r'(?<!\*\*)(?<![\d.])(\d+\.\d*|\.\d+|\d+)')
+SCAN_RANGE = 10.0
+SCAN_POINTS = 4001
+NEWTON_ITERATIONS = 50
+BISECTION_ITERATIONS = 60
+ROOT_TOLERANCE = 1e-9
+QUAD_TOLERANCE = 1e-10
+QUAD_MAX_DEPTH = 30
+QUAD_MAX_INTERVALS = 100000
+QUAD_RESIDUAL_TOLERANCE = 1e-6
+
+
+class SolveState:
+    """
+    Per-session solver state used to warm-start the next solve.
+
+    The expressions and their first and second derivatives are compiled
+    once with their coefficients as parameters, so an edit that only
+    changes coefficients can be re-evaluated without sympy. When f1 - f2
+    is a polynomial in x, poly evaluates its coefficients (highest degree
+    first) so every real root can be bounded and counted.
+    """
+
+    def __init__(self, template, f1, f2, df1, df2, d2f1, d2f2, poly=None):
+        self.template = template
+        self.poly = poly
+        self.f1 = f1
+        self.f2 = f2
+        self.df1 = df1
+        self.df2 = df2
+        self.d2f1 = d2f1
+        self.d2f2 = d2f2
+        self.coeffs1 = ()
+        self.coeffs2 = ()
+        self.roots = []
+        self.brackets = np.empty((0, 2))
+        self.method = None
+        self.verified = False
+
+    def g(self, x_vals):
+        return self.f1(x_vals, *self.coeffs1) - self.f2(x_vals, *self.coeffs2)
+
+    def dg(self, x_vals):
+        return self.df1(x_vals, *self.coeffs1) - self.df2(x_vals, *self.coeffs2)
+
+    def poly_coeffs(self):
+        """
+        Return the coefficients of f1 - f2 without leading zeros, or None
+        if it is not a polynomial in x or is identically zero.
+        """
+        if self.poly is None:
+            return None
+        coeffs = np.atleast_1d(np.asarray(self.poly(*self.coeffs1, *self.coeffs2),
+                                          dtype=float))
+        nonzero = np.flatnonzero(coeffs)
+        if not len(nonzero) or not np.all(np.isfinite(coeffs)):
+            return None
+        return coeffs[nonzero[0]:]
+
+    def root_bound(self):
+        """
+        Return R such that every real root of f1 - f2 lies in [-R, R]
+        (Cauchy bound), or None if the roots cannot be bounded.
+        """
+        coeffs = self.poly_coeffs()
+        if coeffs is None:
+            return None
+        return 1 + np.abs(coeffs[1:] / coeffs[0]).max(initial=0.0)
+
+    def real_roots(self):
+        """
+        Return the distinct real roots of f1 - f2 from its companion matrix
+        (numpy.roots), or None if it is not a polynomial in x.
+        """
+        coeffs = self.poly_coeffs()
+        if coeffs is None:
+            return None
+        roots = np.roots(coeffs)
+        scale = ROOT_TOLERANCE ** 0.5 * (1 + np.abs(roots))
+        roots = np.sort(roots[np.abs(roots.imag) <= scale].real)
+        distinct = np.diff(roots) > ROOT_TOLERANCE ** 0.5 * (1 + np.abs(roots[1:]))
+        return roots[np.concatenate(([True], distinct))] if len(roots) else roots
+
+    def curves(self):
+        """
+        Return (f, f', f'') evaluators for each function with the current
+        coefficients bound.
+        """
+        return [
+            tuple((lambda x_vals, func=func, coeffs=coeffs: func(x_vals, *coeffs))
+                  for func in funcs)
+            for funcs, coeffs in (((self.f1, self.df1, self.d2f1), self.coeffs1),
+                                  ((self.f2, self.df2, self.d2f2), self.coeffs2))
+        ]
+
+
 class EquationSolver:
     def __init__(self):
         self.parser = ExpressionParser()
+        self.state = None
         
     def evaluate_function(self, expr_str, x_val):
         """
@@ -29,9 +129,226 @@ class EquationSolver:
             print(f"Error evaluating {expr_str} at x={x_val}: {str(e)}")
             return np.nan
 
+    def _split_coefficients(self, expr_str, offset):
+        """
+        Replace coefficients with parameter names c<offset>, c<offset+1>, ...
+        Returns the parameterized expression and the coefficient values.
+        """
+        coeffs = [float(m) for m in COEFFICIENT_PATTERN.findall(expr_str)]
+        counter = iter(range(offset, offset + len(coeffs)))
+        template = COEFFICIENT_PATTERN.sub(lambda m: f'c{next(counter)}', expr_str)
+        return template, tuple(coeffs)
+
+    def _compile_state(self, template1, template2, n1, n2):
+        """Compile both parameterized expressions and their derivatives."""
+        x = symbols('x')
+        params1 = symbols(f'c0:{n1}')
+        params2 = symbols(f'c{n1}:{n1 + n2}')
+        expr1 = sympify(template1)
+        expr2 = sympify(template2)
+        try:
+            poly = lambdify((*params1, *params2), Poly(expr1 - expr2, x).all_coeffs(),
+                            'numpy')
+        except PolynomialError:
+            poly = None
+        return SolveState(
+            (template1, template2),
+            lambdify((x, *params1), expr1, 'numpy'),
+            lambdify((x, *params2), expr2, 'numpy'),
+            lambdify((x, *params1), diff(expr1, x), 'numpy'),
+            lambdify((x, *params2), diff(expr2, x), 'numpy'),
+            lambdify((x, *params1), diff(expr1, x, 2), 'numpy'),
+            lambdify((x, *params2), diff(expr2, x, 2), 'numpy'),
+            poly,
+        )
+
+    def _sample(self, func, coeffs, expr_str, x_vals):
+        """
+        Vectorized equivalent of evaluate_function over all x values.
+        """
+        with np.errstate(all='ignore'):
+            y_vals = np.broadcast_to(np.asarray(func(x_vals, *coeffs), dtype=complex),
+                                     x_vals.shape)
+        y_vals = np.where(np.abs(y_vals.imag) > 0, np.nan, y_vals.real)
+        y_vals[np.isposinf(y_vals)] = 100
+        y_vals[np.isneginf(y_vals)] = -100
+        if 'log' in expr_str:
+            y_vals[x_vals <= 0] = np.nan
+        return y_vals
+
+    def _sign_changes(self, func, x_vals, touching=True):
+        """
+        Return the [a, b] grid brackets where func changes sign, plus a
+        degenerate [x, x] bracket for every grid point where func is zero.
+        With touching=False, grid zeros are kept only where the neighbouring
+        samples have opposite signs, so zeros that do not cross are skipped.
+        Identically zero functions have no isolated zeros and give none.
+        """
+        with np.errstate(all='ignore'):
+            vals = np.broadcast_to(func(x_vals), x_vals.shape)
+        finite = np.isfinite(vals)
+        if not np.any(vals[finite] != 0):
+            return np.empty((0, 2))
+
+        change = (np.sign(vals[:-1]) * np.sign(vals[1:]) < 0) & finite[:-1] & finite[1:]
+        idx = np.nonzero(change)[0]
+        zeros = np.nonzero(vals == 0)[0]
+        if not touching:
+            zeros = zeros[(zeros > 0) & (zeros < len(vals) - 1)]
+            zeros = zeros[np.sign(vals[zeros - 1]) * np.sign(vals[zeros + 1]) < 0]
+        return np.concatenate((np.column_stack((x_vals[idx], x_vals[idx + 1])),
+                               np.column_stack((x_vals[zeros], x_vals[zeros]))))
+
+    def _bisect(self, func, brackets):
+        """Refine all brackets at once by vectorized bisection."""
+        a, b = brackets[:, 0].copy(), brackets[:, 1].copy()
+        with np.errstate(all='ignore'):
+            fa = np.broadcast_to(func(a), a.shape)
+            for _ in range(BISECTION_ITERATIONS):
+                mid = (a + b) / 2
+                fm = np.broadcast_to(func(mid), mid.shape)
+                left = np.sign(fm) == np.sign(fa)
+                a = np.where(left, mid, a)
+                fa = np.where(left, fm, fa)
+                b = np.where(left, b, mid)
+        return (a + b) / 2
+
+    def _filter_roots(self, func, candidates, tolerance):
+        """
+        Keep candidates with |func| below tolerance, sorted and deduplicated.
+        """
+        with np.errstate(all='ignore'):
+            residual = np.abs(np.broadcast_to(func(candidates), candidates.shape))
+        candidates = np.sort(candidates[residual < tolerance])
+        roots = []
+        for root in candidates.tolist():
+            if not roots or root - roots[-1] > ROOT_TOLERANCE ** 0.5 * (1 + abs(root)):
+                roots.append(root)
+        return roots
+
+    def _scan_brackets(self, state, roots, bound=0.0):
+        """
+        Find sign changes of f1 - f2 on a grid around the previous roots,
+        extended to cover [-bound, bound].
+        """
+        lo = min([*roots, -SCAN_RANGE]) - 1
+        hi = max([*roots, SCAN_RANGE]) + 1
+        x_vals = np.linspace(lo, hi, SCAN_POINTS)
+        if -bound < lo or bound > hi:
+            x_vals = np.union1d(x_vals, np.linspace(-bound - 1, bound + 1, SCAN_POINTS))
+        return self._sign_changes(state.g, x_vals)
+
+    def _residual_tolerance(self, func, brackets):
+        """
+        ROOT_TOLERANCE scaled by the magnitude of func at the bracket ends,
+        so sign changes across poles are rejected.
+        """
+        if not len(brackets):
+            return ROOT_TOLERANCE
+        with np.errstate(all='ignore'):
+            scale = np.abs(np.broadcast_to(func(brackets), brackets.shape)).max()
+        return ROOT_TOLERANCE * max(1.0, scale)
+
+    def _warm_solve(self, state):
+        """
+        Re-solve numerically from the previous roots and a sign-change scan.
+
+        Newton refines every previous root and every real root of the
+        companion matrix; bisection refines every bracket of a scan that
+        covers the root bound, so roots that appeared are found. Candidates
+        that do not satisfy f1 - f2 = 0 to the residual tolerance (vanished
+        roots, poles) are dropped.
+
+        Returns None when the result cannot be verified: f1 - f2 is not a
+        polynomial, or the roots found disagree in number with the
+        companion-matrix roots (e.g. near-double roots the scan cannot
+        separate).
+        """
+        bound = state.root_bound()
+        if bound is None:
+            return None
+        expected = state.real_roots()
+        brackets = self._scan_brackets(state, state.roots, bound)
+
+        with np.errstate(all='ignore'):
+            newton = np.concatenate((np.array(state.roots, dtype=float), expected))
+            for _ in range(NEWTON_ITERATIONS):
+                step = np.broadcast_to(state.g(newton), newton.shape) / \
+                    np.broadcast_to(state.dg(newton), newton.shape)
+                newton = np.where(np.isfinite(step), newton - step, newton)
+
+        candidates = np.concatenate((newton, self._bisect(state.g, brackets)))
+        roots = self._filter_roots(state.g, candidates,
+                                   self._residual_tolerance(state.g, brackets))
+        if len(roots) != len(expected):
+            return None
+        state.brackets = brackets
+        return roots
+
+    def _find_zeros(self, func, x_vals):
+        """
+        Find sign-changing zeros of func on the grid x_vals.
+        """
+        brackets = self._sign_changes(func, x_vals, touching=False)
+        if not len(brackets):
+            return []
+        return self._filter_roots(func, self._bisect(func, brackets),
+                                  self._residual_tolerance(func, brackets))
+
+    def integrate(self, func, a, b):
+        """
+        Integrate func over each interval [a[i], b[i]] at once.
+
+        Vectorized adaptive Simpson: every pass evaluates all pending
+        sub-intervals in one call and splits only those whose error
+        estimate exceeds QUAD_TOLERANCE per unit width.
+
+        Sub-intervals still unconverged at QUAD_MAX_DEPTH or
+        QUAD_MAX_INTERVALS are accepted only if their summed error estimate
+        is below QUAD_RESIDUAL_TOLERANCE relative to the integral, which
+        holds for integrable endpoint singularities such as sqrt(x) at 0.
+        Otherwise (e.g. across a pole) the integral is nan.
+        """
+        a = np.asarray(a, dtype=float)
+        b = np.asarray(b, dtype=float)
+        owner = np.arange(len(a))
+        total = np.zeros(len(a))
+        residual = np.zeros(len(a))
+
+        for depth in range(QUAD_MAX_DEPTH):
+            if not len(a):
+                break
+            m = (a + b) / 2
+            points = np.stack((a, (a + m) / 2, m, (m + b) / 2, b))
+            h = b - a
+            with np.errstate(all='ignore'):
+                fa, flm, fm, frm, fb = np.broadcast_to(func(points), points.shape)
+                whole = h / 6 * (fa + 4 * fm + fb)
+                halves = h / 12 * (fa + 4 * flm + 2 * fm + 4 * frm + fb)
+                error = np.abs(halves - whole)
+
+                done = (error <= 15 * QUAD_TOLERANCE * np.maximum(h, QUAD_TOLERANCE)) | \
+                    ~np.isfinite(error)
+                if depth == QUAD_MAX_DEPTH - 1 or 2 * np.count_nonzero(~done) > QUAD_MAX_INTERVALS:
+                    np.add.at(residual, owner[~done], error[~done])
+                    done[:] = True
+                np.add.at(total, owner[done], (halves + (halves - whole) / 15)[done])
+
+            split = ~done
+            a, b = np.concatenate((a[split], m[split])), np.concatenate((m[split], b[split]))
+            owner = np.concatenate((owner[split], owner[split]))
+
+        converged = residual <= QUAD_RESIDUAL_TOLERANCE * np.maximum(1.0, np.abs(total))
+        return np.where(converged, total, np.nan)
+
     def solve_functions(self, func1_str, func2_str):
         """
         Solve the system of equations and prepare plot data.
+
+        When only coefficients changed since the previous call and the roots
+        of f1 - f2 can be bounded and counted, the roots are re-solved
+        numerically from the previous ones instead of with sympy;
+        self.state.method records which path produced the result.
         """
         try:
             print(f"Solving equations: {func1_str} = {func2_str}")
@@ -40,15 +357,38 @@ class EquationSolver:
             func1_str = self.parser.format_expression(func1_str)
             func2_str = self.parser.format_expression(func2_str)
             
-            x = symbols('x')
-            func1 = sympify(func1_str)
-            func2 = sympify(func2_str)
+            template1, coeffs1 = self._split_coefficients(func1_str, 0)
+            template2, coeffs2 = self._split_coefficients(func2_str, len(coeffs1))
+            
+            state = self.state
+            solutions = None
+            if state is not None and state.template == (template1, template2):
+                # Small edit: warm-start from the previous roots
+                state.coeffs1, state.coeffs2 = coeffs1, coeffs2
+                solutions = self._warm_solve(state)
             
-            # Solve the equations using sympy
-            solutions = solve(func1 - func2, x)
-            # Filter out complex solutions
-            solutions = [sol.evalf() for sol in solutions if sol.is_real]
-            solutions = [float(sol) for sol in solutions]
+            if solutions is not None:
+                state.method = 'numeric'
+            else:
+                x = symbols('x')
+                func1 = sympify(func1_str)
+                func2 = sympify(func2_str)
+                
+                # Solve the equations using sympy
+                solutions = solve(func1 - func2, x)
+                # Filter out complex solutions
+                solutions = [sol.evalf() for sol in solutions if sol.is_real]
+                solutions = [float(sol) for sol in solutions]
+                
+                state = self._compile_state(template1, template2,
+                                            len(coeffs1), len(coeffs2))
+                state.coeffs1, state.coeffs2 = coeffs1, coeffs2
+                state.brackets = self._scan_brackets(state, solutions)
+                state.method = 'symbolic'
+            
+            state.roots = solutions
+            state.verified = state.method == 'numeric'
+            self.state = state
             
             print(f"Found solutions: {solutions}")
             
@@ -57,8 +397,8 @@ class EquationSolver:
             x_max = max(solutions) + 1 if solutions else 10.0
             
             x_vals = np.linspace(x_min, x_max, 1000)
-            y1_vals = np.array([self.evaluate_function(func1_str, x_val) for x_val in x_vals])
-            y2_vals = np.array([self.evaluate_function(func2_str, x_val) for x_val in x_vals])
+            y1_vals = self._sample(state.f1, coeffs1, func1_str, x_vals)
+            y2_vals = self._sample(state.f2, coeffs2, func2_str, x_vals)
             
             plot_data = (x_vals, y1_vals, y2_vals, solutions, func1_str, func2_str)
             
@@ -66,4 +406,55 @@ class EquationSolver:
             
         except Exception as e:
             print(f"Error in solve_functions: {str(e)}")
-            raise ValueError(f"Error solving equations: {str(e)}")
\ No newline at end of file
+            raise ValueError(f"Error solving equations: {str(e)}")
+
+    def analyze_functions(self, func1_str, func2_str):
+        """
+        Solve the pair and find extrema, inflection points and the areas
+        between the curves over the plotted range.
+
+        Returns (solutions, plot_data, analysis) where analysis has:
+        - 'extrema': (x, y, 'min' | 'max', curve) tuples, curve being 1 or 2
+        - 'inflections': (x, y, curve) tuples
+        - 'areas': (a, b, area) for each pair of consecutive intersections
+          with a finite area
+        """
+        solutions, plot_data = self.solve_functions(func1_str, func2_str)
+        state = self.state
+        x_vals = plot_data[0]
+        scan = np.linspace(x_vals[0], x_vals[-1], SCAN_POINTS)
+        step = scan[1] - scan[0]
+
+        extrema = []
+        inflections = []
+        for curve, (f, df, d2f) in enumerate(state.curves(), 1):
+            critical = np.array(self._find_zeros(df, scan))
+            inflection = np.array(self._find_zeros(d2f, scan))
+            with np.errstate(all='ignore'):
+                # First-derivative test: slope on either side of each zero
+                left = np.broadcast_to(df(critical - step), critical.shape)
+                right = np.broadcast_to(df(critical + step), critical.shape)
+                y_crit = np.broadcast_to(f(critical), critical.shape)
+                y_infl = np.broadcast_to(f(inflection), inflection.shape)
+
+            for x0, y0, l, r in zip(critical.tolist(), y_crit.tolist(),
+                                    left.tolist(), right.tolist()):
+                if l > 0 > r:
+                    extrema.append((x0, y0, 'max', curve))
+                elif l < 0 < r:
+                    extrema.append((x0, y0, 'min', curve))
+            inflections += [(x0, y0, curve)
+                            for x0, y0 in zip(inflection.tolist(), y_infl.tolist())]
+
+        roots = sorted(solutions or [])
+        areas = []
+        if len(roots) > 1:
+            a, b = np.array(roots[:-1]), np.array(roots[1:])
+            integrals = self.integrate(state.g, a, b)
+            # Intervals spanning a pole have no finite area
+            areas = [(lo, hi, abs(v)) for lo, hi, v in zip(a.tolist(), b.tolist(),
+                                                          integrals.tolist())
+                     if np.isfinite(v)]
+
+        analysis = {'extrema': extrema, 'inflections': inflections, 'areas': areas}
+        return solutions, plot_data, analysis
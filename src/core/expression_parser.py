@@ -4,7 +4,7 @@ from sympy import sympify, log
 
 class ExpressionParser:
     def __init__(self):
-        self.valid_chars = set('x0123456789+-*/^() ')
+        self.valid_chars = set('xy0123456789+-*/^() ')
         self.valid_funcs = {'log10', 'sqrt'}
         
     def validate_expression(self, expr):
@@ -38,6 +38,10 @@ class ExpressionParser:
         valid1, msg1 = self.validate_expression(expr1)
         valid2, msg2 = self.validate_expression(expr2)
         return valid1 and valid2
+
+    def is_implicit(self, expr):
+        """Check whether an expression is a relation F(x, y) rather than y = f(x)."""
+        return 'y' in expr
         
     def format_expression(self, expr):
         """Format expression for evaluation."""
@@ -58,7 +62,7 @@ class ExpressionParser:
         expr = re.sub(r'(\))([a-zA-Z0-9])', r'\1*\2', expr)  # )x -> )*x
         expr = re.sub(r'(\d)(\()', r'\1*\2', expr)  # 5( -> 5*(
         expr= re.sub(r'log\((.*?)\)', r'log(\1, 10)', expr)
-        expr = expr.replace('x(', 'x*(')
+        expr = re.sub(r'([xy])(?=[xy(])', r'\1*', expr)  # xy -> x*y, y( -> y*(
         
         
         return expr
\ No newline at end of file
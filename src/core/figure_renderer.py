@@ -0,0 +1,222 @@
+# src/core/figure_renderer.py
+import io
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+from .decimation import decimate_minmax, minmax_indices
+from .equation_solver import EquationSolver
+
+LINE1_COLOR = '#2196F3'
+LINE2_COLOR = '#FF5722'
+SOLUTION_COLOR = '#4CAF50'
+AREA_COLOR = '#9C27B0'
+
+
+def style_axes(ax):
+    """Apply the application's plot styling to an axes."""
+    ax.set_facecolor('#f8f9fa')
+    ax.grid(True, linestyle='--', alpha=0.3, color='gray')
+
+    ax.spines['top'].set_visible(False)
+    ax.spines['right'].set_visible(False)
+    ax.spines['left'].set_color('#666666')
+    ax.spines['bottom'].set_color('#666666')
+
+    ax.tick_params(colors='#666666')
+    ax.set_xlabel('x', fontsize=11, color='#333333')
+    ax.set_ylabel('y', fontsize=11, color='#333333')
+
+
+def annotate_solution(ax, sol, y_sol):
+    """Add the coordinate label for an intersection point."""
+    bbox_props = dict(
+        boxstyle='round,pad=0.5',
+        fc='white',
+        ec=SOLUTION_COLOR,
+        alpha=0.8
+    )
+    return ax.annotate(
+        f'({sol:.2f}, {y_sol:.2f})',
+        (sol, y_sol),
+        xytext=(10, 10),
+        textcoords='offset points',
+        bbox=bbox_props,
+        fontsize=9,
+        color='#333333'
+    )
+
+
+def style_legend(ax):
+    """Create the legend with the application's styling."""
+    legend = ax.legend(
+        frameon=True,
+        facecolor='white',
+        edgecolor='#e0e0e0',
+        fontsize=10
+    )
+    legend.get_frame().set_alpha(0.9)
+    for text in legend.get_texts():
+        text.set_color('#333333')
+    return legend
+
+
+def solution_points(x_vals, y1_vals, solutions):
+    """Return the y value plotted for each solution."""
+    return [y1_vals[np.abs(x_vals - sol).argmin()] for sol in solutions]
+
+
+def draw_analysis(ax, x_vals, y1_vals, y2_vals, analysis):
+    """
+    Draw extrema and inflection markers and shade the areas between curves.
+    """
+    colors = {1: LINE1_COLOR, 2: LINE2_COLOR}
+
+    # Shade on the decimated samples of both curves, clipped to each interval
+    n_bins = int(ax.figure.bbox.width)
+    idx = np.union1d(minmax_indices(y1_vals, n_bins), minmax_indices(y2_vals, n_bins))
+    xs, y1s, y2s = x_vals[idx], y1_vals[idx], y2_vals[idx]
+    for a, b, area in analysis['areas']:
+        inside = (xs >= a) & (xs <= b)
+        ax.fill_between(xs, y1s, y2s, where=inside, color=AREA_COLOR, alpha=0.15,
+                        interpolate=True, zorder=1)
+        if inside.any():
+            mid = (a + b) / 2
+            y_mid = (np.interp(mid, xs, y1s) + np.interp(mid, xs, y2s)) / 2
+            ax.text(mid, y_mid, f'A = {area:.3f}', ha='center', va='center',
+                    fontsize=9, color=AREA_COLOR)
+
+    for x_pt, y_pt, kind, curve in analysis['extrema']:
+        ax.plot(x_pt, y_pt, '^' if kind == 'max' else 'v', color=colors[curve],
+                markersize=9, markeredgecolor='white', zorder=3)
+    for x_pt, y_pt, curve in analysis['inflections']:
+        ax.plot(x_pt, y_pt, 'D', color=colors[curve], markersize=6,
+                markeredgecolor='white', zorder=3)
+
+
+def segments_to_polyline(segments):
+    """
+    Join (M, 2, 2) curve segments into NaN-separated x and y arrays.
+    """
+    segments = np.asarray(segments, dtype=float).reshape(-1, 2, 2)
+    gaps = np.full((len(segments), 1, 2), np.nan)
+    path = np.concatenate((segments, gaps), axis=1).reshape(-1, 2)
+    return path[:, 0], path[:, 1]
+
+
+class FigureRenderer:
+    """
+    Render solver plot data to image files or buffers on the Agg backend.
+
+    A single figure and its line artists are created once and updated in
+    place for every render, so repeated renders avoid rebuilding the axes.
+    """
+
+    def __init__(self, figsize=(8, 6), dpi=100):
+        self.figure = Figure(figsize=figsize, dpi=dpi, facecolor='white')
+        self.canvas = FigureCanvasAgg(self.figure)
+        self.ax = self.figure.add_subplot(111)
+        style_axes(self.ax)
+
+        self.line1, = self.ax.plot([], [], color=LINE1_COLOR, linewidth=2)
+        self.line2, = self.ax.plot([], [], color=LINE2_COLOR, linewidth=2)
+        self.points, = self.ax.plot([], [], 'o', color=SOLUTION_COLOR,
+                                    markersize=8, zorder=3)
+        self.annotations = []
+        self.ax.margins(x=0.1)
+
+    def update(self, x_vals, y1_vals, y2_vals, solutions, func1_str, func2_str):
+        """Update the persistent artists with new plot data."""
+        n_bins = int(self.figure.bbox.width)
+        self.line1.set_data(*decimate_minmax(x_vals, y1_vals, n_bins))
+        self.line2.set_data(*decimate_minmax(x_vals, y2_vals, n_bins))
+        self.line1.set_label(f'f₁(x) = {func1_str}')
+        self.line2.set_label(f'f₂(x) = {func2_str}')
+
+        for annotation in self.annotations:
+            annotation.remove()
+        solutions = solutions or []
+        y_sols = solution_points(x_vals, y1_vals, solutions)
+        self.points.set_data(solutions, y_sols)
+        self.annotations = [annotate_solution(self.ax, sol, y_sol)
+                            for sol, y_sol in zip(solutions, y_sols)]
+
+        style_legend(self.ax)
+        self.ax.relim()
+        self.ax.autoscale_view()
+
+    def render(self, plot_data, path=None, fmt='png'):
+        """
+        Render plot data to a file at path, or to bytes if path is None.
+        """
+        self.update(*plot_data)
+        # Tick labels and legend text change per render, so lay out again
+        self.figure.tight_layout()
+        if path is not None:
+            self.figure.savefig(path, format=fmt)
+            return path
+
+        buffer = io.BytesIO()
+        self.figure.savefig(buffer, format=fmt)
+        return buffer.getvalue()
+
+
+_worker_solver = None
+_worker_renderer = None
+
+
+def _init_worker(figsize, dpi):
+    """Create the per-process solver and persistent figure."""
+    global _worker_solver, _worker_renderer
+    _worker_solver = EquationSolver()
+    _worker_renderer = FigureRenderer(figsize=figsize, dpi=dpi)
+
+
+def _render_task(task):
+    func1_str, func2_str, path, fmt = task
+    try:
+        # Pairs are unrelated; don't warm-start from the previous task
+        _worker_solver.state = None
+        _, plot_data = _worker_solver.solve_functions(func1_str, func2_str)
+        return _worker_renderer.render(plot_data, path, fmt)
+    except ValueError as e:
+        print(f"Error rendering {func1_str} = {func2_str}: {str(e)}")
+        return None
+
+
+def render_batch(pairs, output_dir=None, fmt='png', workers=None,
+                 figsize=(8, 6), dpi=100):
+    """
+    Solve and render many equation pairs over a process pool.
+
+    Each worker keeps one persistent figure. Images are written to
+    output_dir as figure_NNNNN.<fmt>, or returned as bytes when output_dir
+    is None. Returns the list of paths/bytes (None for failed pairs) and
+    the throughput in figures per second.
+    """
+    if fmt not in ('png', 'svg'):
+        raise ValueError(f"Unsupported output format: {fmt}")
+
+    tasks = []
+    for i, (func1_str, func2_str) in enumerate(pairs):
+        path = None
+        if output_dir is not None:
+            path = os.path.join(output_dir, f'figure_{i:05d}.{fmt}')
+        tasks.append((func1_str, func2_str, path, fmt))
+
+    if output_dir is not None:
+        os.makedirs(output_dir, exist_ok=True)
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(figsize, dpi)) as pool:
+        results = list(pool.map(_render_task, tasks, chunksize=8))
+    elapsed = time.perf_counter() - start
+
+    rate = len(tasks) / elapsed if elapsed > 0 else 0.0
+    print(f"Rendered {len(tasks)} figures in {elapsed:.2f}s ({rate:.1f} figures/s)")
+    return results, rate
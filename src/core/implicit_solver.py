@@ -0,0 +1,267 @@
+# src/core/implicit_solver.py
+import numpy as np
+from sympy import symbols, sympify, lambdify, diff
+from .expression_parser import ExpressionParser
+
+DEFAULT_RANGE = (-10.0, 10.0)
+DEFAULT_GRID_SIZE = 1000
+DEFAULT_REFINE = 4
+NEWTON_ITERATIONS = 30
+NEWTON_TOLERANCE = 1e-8
+
+
+def _broadcast(values, shape):
+    """Expand a constant result from a compiled expression to the grid shape."""
+    return np.broadcast_to(np.asarray(values, dtype=float), shape)
+
+
+def _sign_change_cells(F):
+    """
+    Mask of grid cells whose four finite corners do not all share a sign.
+
+    F has shape (..., ny, nx); the mask has shape (..., ny - 1, nx - 1).
+    """
+    finite = np.isfinite(F)
+    positive = F > 0
+    corners = (np.s_[..., :-1, :-1], np.s_[..., :-1, 1:],
+               np.s_[..., 1:, 1:], np.s_[..., 1:, :-1])
+    valid = finite[corners[0]] & finite[corners[1]] & finite[corners[2]] & finite[corners[3]]
+    any_positive = positive[corners[0]] | positive[corners[1]] | \
+        positive[corners[2]] | positive[corners[3]]
+    all_positive = positive[corners[0]] & positive[corners[1]] & \
+        positive[corners[2]] & positive[corners[3]]
+    return valid & any_positive & ~all_positive
+
+
+def _marching_squares(X, Y, F, cells):
+    """
+    Extract zero-level segments from sampled grids.
+
+    X, Y and F have shape (..., ny, nx); leading axes are independent grids.
+    Only the cells flagged in the mask from _sign_change_cells are
+    interpolated. Returns the segments as an (M, 2, 2) array of endpoints
+    and the corner magnitude of the cell each segment came from.
+    """
+    idx = np.nonzero(cells)
+    lead, rows, cols = idx[:-2], idx[-2], idx[-1]
+    offsets = ((0, 0), (0, 1), (1, 1), (1, 0))
+    corner_idx = [lead + (rows + di, cols + dj) for di, dj in offsets]
+    xs = np.stack([X[i] for i in corner_idx], axis=-1)
+    ys = np.stack([Y[i] for i in corner_idx], axis=-1)
+    values = np.stack([F[i] for i in corner_idx], axis=-1)
+    positive = values > 0
+
+    # Edges: bottom (0-1), right (1-2), top (3-2), left (0-3)
+    edges = ((0, 1), (1, 2), (3, 2), (0, 3))
+    crossings = np.stack([positive[:, a] != positive[:, b] for a, b in edges], axis=-1)
+    points = []
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for a, b in edges:
+            t = values[:, a] / (values[:, a] - values[:, b])
+            points.append(np.stack((xs[:, a] + t * (xs[:, b] - xs[:, a]),
+                                    ys[:, a] + t * (ys[:, b] - ys[:, a])), axis=-1))
+    points = np.stack(points, axis=-2)
+
+    count = crossings.sum(axis=-1)
+    scale = np.abs(values).max(axis=-1)
+
+    # Ordinary cells: one segment between the two crossed edges
+    two = count == 2
+    first = crossings.argmax(axis=-1)
+    last = 3 - crossings[:, ::-1].argmax(axis=-1)
+    p_first = np.take_along_axis(points, first[:, None, None], axis=-2)[:, 0, :]
+    p_last = np.take_along_axis(points, last[:, None, None], axis=-2)[:, 0, :]
+    segments = [np.stack((p_first[two], p_last[two]), axis=1)]
+    scales = [scale[two]]
+
+    # Saddle cells: resolve the ambiguity with the cell-centre value
+    four = count == 4
+    if four.any():
+        p = points[four]
+        centre_like_v0 = (values[four].mean(axis=-1) > 0) == positive[four][:, 0]
+        seg_a = np.where(centre_like_v0[:, None, None],
+                         p[:, [0, 1]], p[:, [3, 0]])
+        seg_b = np.where(centre_like_v0[:, None, None],
+                         p[:, [2, 3]], p[:, [1, 2]])
+        segments += [seg_a, seg_b]
+        scales += [scale[four], scale[four]]
+
+    return np.concatenate(segments), np.concatenate(scales)
+
+
+class ImplicitSolver:
+    """
+    Trace implicit curves F(x, y) = 0 and intersect pairs of them.
+    """
+
+    def __init__(self):
+        self.parser = ExpressionParser()
+
+    def as_relation(self, expr_str):
+        """
+        Return expr_str as a relation F(x, y); an explicit f(x) is read as
+        the curve y = f(x), i.e. y - (f(x)).
+        """
+        if self.parser.is_implicit(expr_str):
+            return expr_str
+        return f'y - ({expr_str})'
+
+    def compile_expression(self, expr_str):
+        """
+        Compile an expression in x and y to a vectorized NumPy evaluator.
+        """
+        x, y = symbols('x y')
+        expr = sympify(self.parser.format_expression(expr_str))
+        return lambdify((x, y), expr, 'numpy'), expr
+
+    def evaluate_grid(self, func, x_range, y_range, resolution):
+        """
+        Evaluate a compiled expression on a resolution x resolution mesh.
+        """
+        xs = np.linspace(x_range[0], x_range[1], resolution)
+        ys = np.linspace(y_range[0], y_range[1], resolution)
+        X, Y = np.meshgrid(xs, ys)
+        with np.errstate(all='ignore'):
+            F = _broadcast(func(X, Y), X.shape)
+        return X, Y, F
+
+    def _refine(self, func, X, Y, cells, refine):
+        """
+        Re-sample cells with a sign change on a refine x refine sub-grid.
+        """
+        rows, cols = np.nonzero(cells)
+        x0 = X[rows, cols]
+        y0 = Y[rows, cols]
+        dx = X[rows, cols + 1] - x0
+        dy = Y[rows + 1, cols] - y0
+
+        u = np.linspace(0.0, 1.0, refine + 1)
+        sub_x = x0[:, None, None] + dx[:, None, None] * u[None, None, :]
+        sub_y = y0[:, None, None] + dy[:, None, None] * u[None, :, None]
+        sub_x, sub_y = np.broadcast_arrays(sub_x, sub_y)
+        with np.errstate(all='ignore'):
+            sub_f = _broadcast(func(sub_x, sub_y), sub_x.shape)
+        return sub_x, sub_y, sub_f
+
+    def _trace(self, func, X, Y, F, cells, refine):
+        """Trace the curve from an evaluated grid and its sign-change cells."""
+        if refine > 1 and cells.any():
+            X, Y, F = self._refine(func, X, Y, cells, refine)
+            cells = _sign_change_cells(F)
+        segments, scales = _marching_squares(X, Y, F, cells)
+
+        if not len(segments):
+            return segments
+
+        # Drop segments across poles, where |F| grows instead of vanishing
+        mid = segments.mean(axis=1)
+        with np.errstate(all='ignore'):
+            f_mid = _broadcast(func(mid[:, 0], mid[:, 1]), scales.shape)
+        return segments[np.abs(f_mid) <= scales]
+
+    def trace_curve(self, expr_str, x_range=DEFAULT_RANGE, y_range=DEFAULT_RANGE,
+                    resolution=DEFAULT_GRID_SIZE, refine=DEFAULT_REFINE):
+        """
+        Extract the curve F(x, y) = 0 as an (M, 2, 2) array of segments.
+        """
+        func, _ = self.compile_expression(expr_str)
+        X, Y, F = self.evaluate_grid(func, x_range, y_range, resolution)
+        return self._trace(func, X, Y, F, _sign_change_cells(F), refine)
+
+    def _intersect(self, compiled1, compiled2, X, Y, cells1, cells2):
+        """
+        Newton-refine seeds from cells where both functions change sign.
+        """
+        x, y = symbols('x y')
+        f1, expr1 = compiled1
+        f2, expr2 = compiled2
+        rows, cols = np.nonzero(cells1 & cells2)
+        if not len(rows):
+            return []
+
+        jac = [lambdify((x, y), diff(e, v), 'numpy')
+               for e in (expr1, expr2) for v in (x, y)]
+        px = (X[rows, cols] + X[rows, cols + 1]) / 2
+        py = (Y[rows, cols] + Y[rows + 1, cols]) / 2
+        with np.errstate(all='ignore'):
+            for _ in range(NEWTON_ITERATIONS):
+                shape = px.shape
+                g1 = _broadcast(f1(px, py), shape)
+                g2 = _broadcast(f2(px, py), shape)
+                a, b, c, d = (_broadcast(j(px, py), shape) for j in jac)
+                det = a * d - b * c
+                px = px - (g1 * d - g2 * b) / det
+                py = py - (a * g2 - c * g1) / det
+
+            g1 = _broadcast(f1(px, py), px.shape)
+            g2 = _broadcast(f2(px, py), px.shape)
+
+        x_min, x_max = X[0, 0], X[0, -1]
+        y_min, y_max = Y[0, 0], Y[-1, 0]
+        converged = (
+            (np.abs(g1) < NEWTON_TOLERANCE)
+            & (np.abs(g2) < NEWTON_TOLERANCE)
+            & (px >= x_min) & (px <= x_max)
+            & (py >= y_min) & (py <= y_max)
+        )
+        candidates = sorted(zip(px[converged].tolist(), py[converged].tolist()))
+
+        # Seeds from neighbouring cells converge to the same point
+        spacing = X[0, 1] - X[0, 0]
+        points = []
+        for point in candidates:
+            if all(np.hypot(point[0] - p[0], point[1] - p[1]) > spacing
+                   for p in points):
+                points.append(point)
+        return points
+
+    def find_intersections(self, func1_str, func2_str, x_range=DEFAULT_RANGE,
+                           y_range=DEFAULT_RANGE, resolution=DEFAULT_GRID_SIZE):
+        """
+        Find points where F1(x, y) = 0 and F2(x, y) = 0.
+
+        Cells where both functions change sign seed a vectorized Newton
+        iteration on the 2x2 system; converged points are deduplicated.
+        """
+        compiled1 = self.compile_expression(func1_str)
+        compiled2 = self.compile_expression(func2_str)
+        X, Y, F1 = self.evaluate_grid(compiled1[0], x_range, y_range, resolution)
+        _, _, F2 = self.evaluate_grid(compiled2[0], x_range, y_range, resolution)
+        return self._intersect(compiled1, compiled2, X, Y,
+                               _sign_change_cells(F1), _sign_change_cells(F2))
+
+    def solve_implicit(self, func1_str, func2_str, x_range=DEFAULT_RANGE,
+                       y_range=DEFAULT_RANGE, resolution=DEFAULT_GRID_SIZE):
+        """
+        Trace both implicit curves and intersect them.
+
+        An input without y is an explicit curve y = f(x). Each grid is
+        evaluated once and shared by tracing and intersection.
+        """
+        try:
+            func1_str = self.as_relation(func1_str)
+            func2_str = self.as_relation(func2_str)
+            print(f"Solving implicit curves: {func1_str} = 0, {func2_str} = 0")
+
+            compiled1 = self.compile_expression(func1_str)
+            compiled2 = self.compile_expression(func2_str)
+            X, Y, F1 = self.evaluate_grid(compiled1[0], x_range, y_range, resolution)
+            _, _, F2 = self.evaluate_grid(compiled2[0], x_range, y_range, resolution)
+            cells1 = _sign_change_cells(F1)
+            cells2 = _sign_change_cells(F2)
+
+            segments1 = self._trace(compiled1[0], X, Y, F1, cells1, DEFAULT_REFINE)
+            segments2 = self._trace(compiled2[0], X, Y, F2, cells2, DEFAULT_REFINE)
+            points = self._intersect(compiled1, compiled2, X, Y, cells1, cells2)
+
+            print(f"Found intersections: {points}")
+
+            func1_str = self.parser.format_expression(func1_str)
+            func2_str = self.parser.format_expression(func2_str)
+            plot_data = (segments1, segments2, points, func1_str, func2_str)
+
+            return points if points else None, plot_data
+
+        except Exception as e:
+            print(f"Error in solve_implicit: {str(e)}")
+            raise ValueError(f"Error solving implicit curves: {str(e)}")
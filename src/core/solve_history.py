@@ -0,0 +1,195 @@
+# src/core/solve_history.py
+import copy
+import json
+import os
+import tempfile
+import zipfile
+from collections import OrderedDict
+
+import numpy as np
+from .decimation import minmax_indices
+
+HISTORY_PATH = os.path.join(os.path.expanduser('~'), '.basic-calc', 'history.npz')
+HISTORY_MEMORY_CAP = 8 * 1024 * 1024  # bytes of stored arrays, strings and state data
+HISTORY_PLOT_BINS = 1000
+
+
+class HistoryEntry:
+    """
+    A solved equation pair stored for instant recall.
+
+    Plot arrays are float32 and already decimated; state is the solver's
+    compiled SolveState (explicit pairs only, not persisted to disk) and
+    analysis the result of EquationSolver.analyze_functions, if any.
+    """
+
+    __slots__ = ('func1_str', 'func2_str', 'labels', 'implicit',
+                 'solutions', 'arrays', 'state', 'analysis')
+
+    def __init__(self, func1_str, func2_str, labels, implicit, solutions,
+                 arrays, state=None, analysis=None):
+        self.func1_str = func1_str
+        self.func2_str = func2_str
+        self.labels = labels
+        self.implicit = implicit
+        self.solutions = solutions
+        self.arrays = arrays
+        self.state = state
+        self.analysis = analysis
+
+    @property
+    def key(self):
+        return (self.func1_str, self.func2_str)
+
+    @property
+    def nbytes(self):
+        """
+        Approximate memory use. The state's compiled functions are shared
+        with the solver and other copies of the state, so only its own
+        coefficients, roots and brackets are counted.
+        """
+        text = len(self.func1_str) + len(self.func2_str) + sum(map(len, self.labels))
+        size = sum(a.nbytes for a in self.arrays) + 16 * len(self.solutions) + text
+        if self.analysis is not None:
+            size += sum(8 * len(item) for items in self.analysis.values() for item in items)
+        if self.state is not None:
+            size += self.state.brackets.nbytes + 8 * (
+                len(self.state.coeffs1) + len(self.state.coeffs2) + len(self.state.roots))
+        return size
+
+    def plot_data(self):
+        """
+        Return arguments for PlotWidget.plot_implicit or plot_functions.
+        """
+        return (*self.arrays, list(self.solutions), *self.labels)
+
+    @classmethod
+    def from_plot_data(cls, func1_str, func2_str, plot_data, implicit, state=None,
+                       analysis=None):
+        """Build a compact entry from solver plot data."""
+        if implicit:
+            segments1, segments2, points, label1, label2 = plot_data
+            arrays = (np.asarray(segments1, dtype=np.float32),
+                      np.asarray(segments2, dtype=np.float32))
+            solutions = tuple(tuple(p) for p in points or [])
+        else:
+            x_vals, y1_vals, y2_vals, solutions, label1, label2 = plot_data
+            # Keep the extremes of both curves on a shared x axis
+            idx = np.union1d(minmax_indices(y1_vals, HISTORY_PLOT_BINS),
+                             minmax_indices(y2_vals, HISTORY_PLOT_BINS))
+            arrays = tuple(np.asarray(a, dtype=np.float32)[idx]
+                           for a in (x_vals, y1_vals, y2_vals))
+            solutions = tuple(solutions or [])
+
+        return cls(func1_str, func2_str, (label1, label2), implicit, solutions,
+                   arrays, copy.copy(state), copy.deepcopy(analysis))
+
+
+class SolveHistory:
+    """
+    Most-recently-used history of solved pairs, capped by memory use.
+    """
+
+    def __init__(self, max_bytes=HISTORY_MEMORY_CAP):
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __iter__(self):
+        """Iterate over entries, most recent first."""
+        return iter(reversed(list(self._entries.values())))
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def add(self, func1_str, func2_str, plot_data, implicit=False, state=None,
+            analysis=None):
+        """Store a solved pair, evicting the oldest entries over the cap."""
+        entry = HistoryEntry.from_plot_data(func1_str.strip(), func2_str.strip(),
+                                            plot_data, implicit, state, analysis)
+        self._insert(entry)
+        return entry
+
+    def _insert(self, entry):
+        old = self._entries.pop(entry.key, None)
+        if old is not None:
+            self.nbytes -= old.nbytes
+        self._entries[entry.key] = entry
+        self.nbytes += entry.nbytes
+
+        while self.nbytes > self.max_bytes and len(self._entries) > 1:
+            _, evicted = self._entries.popitem(last=False)
+            self.nbytes -= evicted.nbytes
+
+    def recall(self, key):
+        """Return the entry for key and mark it as most recently used."""
+        entry = self._entries[key]
+        self._entries.move_to_end(key)
+        return entry
+
+    def save(self, path=HISTORY_PATH):
+        """
+        Write the history to an .npz file (compiled state is not saved).
+
+        The file is written next to path and then moved into place, so an
+        interrupted save leaves the previous history intact.
+        """
+        meta = []
+        arrays = {}
+        for i, entry in enumerate(self._entries.values()):
+            meta.append({
+                'func1': entry.func1_str,
+                'func2': entry.func2_str,
+                'labels': list(entry.labels),
+                'implicit': entry.implicit,
+                'solutions': [list(s) if entry.implicit else s
+                              for s in entry.solutions],
+                'arrays': len(entry.arrays),
+                'analysis': entry.analysis,
+            })
+            for j, array in enumerate(entry.arrays):
+                arrays[f'e{i}_{j}'] = array
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory or '.', suffix='.npz.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                np.savez_compressed(f, meta=np.array(json.dumps(meta)), **arrays)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
+    @classmethod
+    def load(cls, path=HISTORY_PATH, max_bytes=HISTORY_MEMORY_CAP):
+        """Read a history saved with save(); missing or bad files give an empty one."""
+        history = cls(max_bytes)
+        if not os.path.exists(path):
+            return history
+
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                for i, item in enumerate(json.loads(str(data['meta']))):
+                    solutions = item['solutions']
+                    if item['implicit']:
+                        solutions = [tuple(s) for s in solutions]
+                    arrays = tuple(data[f'e{i}_{j}'] for j in range(item['arrays']))
+                    analysis = item.get('analysis')
+                    if analysis is not None:
+                        analysis = {name: [tuple(v) for v in values]
+                                    for name, values in analysis.items()}
+                    history._insert(HistoryEntry(
+                        item['func1'], item['func2'], tuple(item['labels']),
+                        item['implicit'], tuple(solutions), arrays,
+                        analysis=analysis))
+        except (OSError, ValueError, KeyError, TypeError,
+                zipfile.BadZipFile, json.JSONDecodeError) as e:
+            print(f"Error loading history from {path}: {str(e)}")
+            return cls(max_bytes)
+
+        return history
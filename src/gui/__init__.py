@@ -1,5 +1,6 @@
 from .main_window import MainWindow
 from .input_panel import InputPanel
 from .plot_widget import PlotWidget
+from .history_panel import HistoryPanel
 
-__all__ = ['MainWindow', 'InputPanel', 'PlotWidget']
\ No newline at end of file
+__all__ = ['MainWindow', 'InputPanel', 'PlotWidget', 'HistoryPanel']
\ No newline at end of file
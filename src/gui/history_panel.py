@@ -0,0 +1,55 @@
+from PySide2.QtWidgets import QWidget, QVBoxLayout, QLabel, QListWidget, QListWidgetItem
+from PySide2.QtCore import Signal, Qt
+from PySide2.QtGui import QFont
+
+
+class HistoryPanel(QWidget):
+    entry_selected = Signal(object)
+
+    def __init__(self):
+        super().__init__()
+        self.setup_ui()
+
+    def setup_ui(self):
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(8)
+
+        label = QLabel("History:")
+        label.setFont(QFont("Segoe UI", 11))
+
+        self.list_widget = QListWidget()
+        self.list_widget.setStyleSheet("""
+            QListWidget {
+                border: 2px solid #e0e0e0;
+                border-radius: 6px;
+                background-color: white;
+                font-family: 'Consolas';
+                font-size: 13px;
+            }
+            QListWidget::item {
+                padding: 6px;
+            }
+            QListWidget::item:hover {
+                background-color: #f5f5f5;
+            }
+            QListWidget::item:selected {
+                background-color: #e3f2fd;
+                color: #1a1a1a;
+            }
+        """)
+        self.list_widget.itemClicked.connect(self._on_item_clicked)
+
+        layout.addWidget(label)
+        layout.addWidget(self.list_widget)
+
+    def refresh(self, history):
+        """Show the history entries, most recent first."""
+        self.list_widget.clear()
+        for entry in history:
+            item = QListWidgetItem(f"{entry.func1_str} = {entry.func2_str}")
+            item.setData(Qt.UserRole, entry.key)
+            self.list_widget.addItem(item)
+
+    def _on_item_clicked(self, item):
+        self.entry_selected.emit(item.data(Qt.UserRole))
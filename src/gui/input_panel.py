@@ -1,9 +1,11 @@
 from PySide2.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
-                             QLineEdit, QPushButton, QGridLayout, QMessageBox)
+                             QLineEdit, QPushButton, QGridLayout, QMessageBox,
+                             QCheckBox)
 from PySide2.QtCore import Signal, Qt
 from PySide2.QtGui import QFont, QPalette, QColor
 from core.equation_solver import EquationSolver
 from core.expression_parser import ExpressionParser
+from core.implicit_solver import ImplicitSolver
 
 class InputPanel(QWidget):
     solve_requested = Signal(str, str)
@@ -11,6 +13,7 @@ class InputPanel(QWidget):
     def __init__(self):
         super().__init__()
         self.solver = EquationSolver()
+        self.implicit_solver = ImplicitSolver()
         self.parser = ExpressionParser()
         self.active_input = None
         self.setup_ui()
@@ -62,6 +65,10 @@ class InputPanel(QWidget):
         """)
         solve_button.clicked.connect(self._on_solve_clicked)
         
+        # Analysis mode: extrema, inflection points and areas between curves
+        self.analysis_checkbox = QCheckBox("Analysis mode (extrema, inflections, areas)")
+        self.analysis_checkbox.setFont(QFont("Segoe UI", 10))
+        
         # Result label with modern styling
         self.result_label = QLabel("")
         self.result_label.setWordWrap(True)
@@ -79,6 +86,7 @@ class InputPanel(QWidget):
         layout.addLayout(self.func1_input)
         layout.addLayout(self.func2_input)
         layout.addLayout(button_grid)
+        layout.addWidget(self.analysis_checkbox)
         layout.addWidget(solve_button)
         layout.addWidget(self.result_label)
         layout.addStretch()
@@ -170,6 +178,11 @@ class InputPanel(QWidget):
         self.active_input.setFocus()
         self.active_input.setCursorPosition(cursor_pos + len(expr))
 
+    def set_expressions(self, func1_str, func2_str):
+        """Fill both input fields."""
+        self.func1_input.itemAt(1).widget().setText(func1_str)
+        self.func2_input.itemAt(1).widget().setText(func2_str)
+
     def _clear_input(self):
         """Clear the active input field."""
         self.func1_input.itemAt(1).widget().clear()
@@ -192,18 +205,48 @@ class InputPanel(QWidget):
         func1_str = self.func1_input.itemAt(1).widget().text()
         func2_str = self.func2_input.itemAt(1).widget().text()
         
+        if self.is_implicit():
+            return self.implicit_solver.solve_implicit(func1_str, func2_str)
         return self.solver.solve_functions(func1_str, func2_str)
+
+    def get_analysis(self):
+        """Get solutions, plot data and calculus analysis for the current functions."""
+        func1_str = self.func1_input.itemAt(1).widget().text()
+        func2_str = self.func2_input.itemAt(1).widget().text()
+        
+        return self.solver.analyze_functions(func1_str, func2_str)
+
+    def is_analysis_mode(self):
+        """Check whether analysis mode applies to the current inputs."""
+        return self.analysis_checkbox.isChecked() and not self.is_implicit()
+
+    def is_implicit(self):
+        """Check whether the current inputs describe implicit curves F(x, y) = 0."""
+        func1_str = self.func1_input.itemAt(1).widget().text()
+        func2_str = self.func2_input.itemAt(1).widget().text()
+        return self.parser.is_implicit(func1_str) or self.parser.is_implicit(func2_str)
         
-    def display_results(self, solutions):
-        """Display the solutions in the result label."""
+    def display_results(self, solutions, analysis=None):
+        """Display the solutions, and analysis results if any, in the result label."""
         if not solutions:
-            self.result_label.setText("No real solutions found")
-            return
-            
-        result_text = "Solutions:\n"
-        for i, sol in enumerate(solutions, 1):
-            result_text += f"x{i} = {sol:.4f}\n"
-        self.result_label.setText(result_text)
+            result_text = "No real solutions found\n"
+        else:
+            result_text = "Solutions:\n"
+            for i, sol in enumerate(solutions, 1):
+                if isinstance(sol, tuple):
+                    result_text += f"P{i} = ({sol[0]:.4f}, {sol[1]:.4f})\n"
+                else:
+                    result_text += f"x{i} = {sol:.4f}\n"
+        
+        if analysis:
+            for x_pt, y_pt, kind, curve in analysis['extrema']:
+                result_text += f"f{curve} {kind} at ({x_pt:.4f}, {y_pt:.4f})\n"
+            for x_pt, y_pt, curve in analysis['inflections']:
+                result_text += f"f{curve} inflection at ({x_pt:.4f}, {y_pt:.4f})\n"
+            for a, b, area in analysis['areas']:
+                result_text += f"Area on [{a:.4f}, {b:.4f}] = {area:.4f}\n"
+        
+        self.result_label.setText(result_text.rstrip())
         
     def show_error(self, message):
         """Show error message to user."""
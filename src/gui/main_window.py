@@ -1,18 +1,29 @@
+import copy
+import os
 from PySide2.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, 
-                             QHBoxLayout, QGridLayout, QLabel)
+                             QHBoxLayout, QGridLayout, QLabel, QShortcut)
 from PySide2.QtCore import Qt
-from PySide2.QtGui import QFont, QPalette, QColor
+from PySide2.QtGui import QFont, QPalette, QColor, QKeySequence
 from .input_panel import InputPanel
 from .plot_widget import PlotWidget
+from .history_panel import HistoryPanel
+from core.solve_history import SolveHistory, HISTORY_PATH
+from .watchdog import EventLoopWatchdog, TelemetryOverlay
+
+TELEMETRY_DUMP_NAME = 'telemetry.json'  # written next to the history file
 
 
 class MainWindow(QMainWindow):
-    def __init__(self):
+    def __init__(self, history_path=HISTORY_PATH):
         super().__init__()
         self.setWindowTitle("Modern Function Solver & Plotter")
         self.setGeometry(100, 100, 1200, 800)
+        self.watchdog = EventLoopWatchdog(self)
+        self.history_path = history_path
+        self.history = SolveHistory.load(history_path)
         self.setup_ui()
         self.setup_styling()
+        self.setup_telemetry()
         
     def setup_ui(self):
         # Create central widget with dark background
@@ -40,6 +51,11 @@ class MainWindow(QMainWindow):
         self.input_panel = InputPanel()
         left_layout.addWidget(self.input_panel)
         
+        # Add history panel
+        self.history_panel = HistoryPanel()
+        self.history_panel.refresh(self.history)
+        left_layout.addWidget(self.history_panel)
+        
         # Right panel for plot (2/3 width)
         right_panel = QWidget()
         right_layout = QVBoxLayout(right_panel)
@@ -54,6 +70,7 @@ class MainWindow(QMainWindow):
         
         # Connect signals
         self.input_panel.solve_requested.connect(self.solve_and_plot)
+        self.history_panel.entry_selected.connect(self.recall_history)
         
     def setup_styling(self):
         # Set modern color scheme
@@ -65,11 +82,68 @@ class MainWindow(QMainWindow):
         palette.setColor(QPalette.Button, QColor("#ffffff"))
         self.setPalette(palette)
         
+    def setup_telemetry(self):
+        # Developer overlay (Ctrl+Shift+D) and telemetry dump (Ctrl+Shift+T)
+        self.telemetry_overlay = TelemetryOverlay(self.watchdog, self.central_widget)
+        QShortcut(QKeySequence("Ctrl+Shift+D"), self, self.telemetry_overlay.toggle)
+        QShortcut(QKeySequence("Ctrl+Shift+T"), self, self.dump_telemetry)
+        
+        self.watchdog.watch_keystrokes(self.input_panel.func1_input.itemAt(1).widget())
+        self.watchdog.watch_keystrokes(self.input_panel.func2_input.itemAt(1).widget())
+        self.watchdog.start()
+        
+    def dump_telemetry(self):
+        path = os.path.join(os.path.dirname(self.history_path), TELEMETRY_DUMP_NAME)
+        self.watchdog.dump(path)
+        print(f"Telemetry written to {path}")
+        
+    def closeEvent(self, event):
+        self.watchdog.stop()
+        try:
+            self.history.save(self.history_path)
+        except OSError as e:
+            print(f"Error saving history: {str(e)}")
+        super().closeEvent(event)
+        
     def solve_and_plot(self, func1_str, func2_str):
         try:
-            solutions, plot_data = self.input_panel.get_solutions()
+            with self.watchdog.measure('click-to-plot'):
+                analysis = None
+                with self.watchdog.measure('solve'):
+                    if self.input_panel.is_analysis_mode():
+                        solutions, plot_data, analysis = self.input_panel.get_analysis()
+                    else:
+                        solutions, plot_data = self.input_panel.get_solutions()
+                implicit = self.input_panel.is_implicit()
+                with self.watchdog.measure('plot'):
+                    if plot_data:
+                        self.plot(plot_data, implicit, analysis)
+                self.input_panel.display_results(solutions, analysis)
+            
             if plot_data:
-                self.plot_widget.plot_functions(*plot_data)
-            self.input_panel.display_results(solutions)
+                state = None if implicit else self.input_panel.solver.state
+                self.history.add(func1_str, func2_str, plot_data, implicit, state,
+                                 analysis)
+                self.history_panel.refresh(self.history)
         except Exception as e:
-            self.input_panel.show_error(str(e))
\ No newline at end of file
+            self.input_panel.show_error(str(e))
+            
+    def plot(self, plot_data, implicit, analysis=None):
+        if implicit:
+            self.plot_widget.plot_implicit(*plot_data)
+        else:
+            self.plot_widget.plot_functions(*plot_data, analysis=analysis)
+            
+    def recall_history(self, key):
+        """Restore a history entry's inputs and plot without re-solving."""
+        with self.watchdog.measure('history-recall'):
+            entry = self.history.recall(key)
+            self.input_panel.set_expressions(entry.func1_str, entry.func2_str)
+            self.plot(entry.plot_data(), entry.implicit, entry.analysis)
+            self.input_panel.display_results(list(entry.solutions) or None,
+                                             entry.analysis)
+            self.history_panel.refresh(self.history)
+            
+            # Let the next coefficient edit warm-start from this entry
+            if entry.state is not None:
+                self.input_panel.solver.state = copy.copy(entry.state)
\ No newline at end of file
@@ -4,7 +4,10 @@ matplotlib.use('Qt5Agg')
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
 from matplotlib.figure import Figure
-import numpy as np
+from core.decimation import decimate_minmax
+from core.figure_renderer import (style_axes, annotate_solution, style_legend,
+                                  solution_points, segments_to_polyline, draw_analysis,
+                                  LINE1_COLOR, LINE2_COLOR, SOLUTION_COLOR)
 
 class PlotWidget(QWidget):
     def __init__(self):
@@ -43,73 +46,64 @@ class PlotWidget(QWidget):
         layout.addWidget(self.toolbar)
         layout.addWidget(self.canvas)
         
-    def plot_functions(self, x_vals, y1_vals, y2_vals, solutions, func1_str, func2_str):
+    def plot_functions(self, x_vals, y1_vals, y2_vals, solutions, func1_str, func2_str,
+                       analysis=None):
         self.figure.clear()
         ax = self.figure.add_subplot(111)
         
-        # Modern styling for the plot
-        ax.set_facecolor('#f8f9fa')
+        # Modern styling shared with the headless renderer
+        style_axes(ax)
         
-        # Set modern grid style
-        ax.grid(True, linestyle='--', alpha=0.3, color='gray')
-        
-        # Set modern spines
-        ax.spines['top'].set_visible(False)
-        ax.spines['right'].set_visible(False)
-        ax.spines['left'].set_color('#666666')
-        ax.spines['bottom'].set_color('#666666')
-        
-        # Modern tick styling
-        ax.tick_params(colors='#666666')
+        # Decimate to the canvas pixel width before handing data to matplotlib
+        n_bins = int(self.figure.bbox.width)
+        x1_plot, y1_plot = decimate_minmax(x_vals, y1_vals, n_bins)
+        x2_plot, y2_plot = decimate_minmax(x_vals, y2_vals, n_bins)
         
         # Plot with modern colors
-        line1, = ax.plot(x_vals, y1_vals, label=f'f₁(x) = {func1_str}', 
-                        color='#2196F3', linewidth=2)
-        line2, = ax.plot(x_vals, y2_vals, label=f'f₂(x) = {func2_str}', 
-                        color='#FF5722', linewidth=2)
+        line1, = ax.plot(x1_plot, y1_plot, label=f'f₁(x) = {func1_str}', 
+                        color=LINE1_COLOR, linewidth=2)
+        line2, = ax.plot(x2_plot, y2_plot, label=f'f₂(x) = {func2_str}', 
+                        color=LINE2_COLOR, linewidth=2)
         
         if solutions:
-            for sol in solutions:
-                idx = np.abs(x_vals - sol).argmin()
-                y_sol = y1_vals[idx]
-                ax.plot(sol, y_sol, 'o', color='#4CAF50', markersize=8, 
+            y_sols = solution_points(x_vals, y1_vals, solutions)
+            for sol, y_sol in zip(solutions, y_sols):
+                ax.plot(sol, y_sol, 'o', color=SOLUTION_COLOR, markersize=8, 
                        zorder=3)  # Ensure points are above grid
-                
-                # Modern annotation style
-                bbox_props = dict(
-                    boxstyle='round,pad=0.5',
-                    fc='white',
-                    ec='#4CAF50',
-                    alpha=0.8
-                )
-                ax.annotate(
-                    f'({sol:.2f}, {y_sol:.2f})',
-                    (sol, y_sol),
-                    xytext=(10, 10),
-                    textcoords='offset points',
-                    bbox=bbox_props,
-                    fontsize=9,
-                    color='#333333'
-                )
-        
-        # Modern font styling for labels
-        ax.set_xlabel('x', fontsize=11, color='#333333')
-        ax.set_ylabel('y', fontsize=11, color='#333333')
-        
-        # Legend styling
-        legend = ax.legend(
-            frameon=True,
-            facecolor='white',
-            edgecolor='#e0e0e0',
-            fontsize=10
-        )
-        legend.get_frame().set_alpha(0.9)
-        for text in legend.get_texts():
-            text.set_color('#333333')
+                annotate_solution(ax, sol, y_sol)
+        
+        # Extrema, inflection points and shaded areas from analysis mode
+        if analysis:
+            draw_analysis(ax, x_vals, y1_vals, y2_vals, analysis)
+        
+        style_legend(ax)
         
         # Set margins
         ax.margins(x=0.1)
         
         # Adjust layout and display
+        self.figure.tight_layout()
+        self.canvas.draw()
+
+    def plot_implicit(self, segments1, segments2, points, func1_str, func2_str):
+        self.figure.clear()
+        ax = self.figure.add_subplot(111)
+        
+        style_axes(ax)
+        
+        # Marching-squares segments are drawn as one NaN-separated line each
+        ax.plot(*segments_to_polyline(segments1), label=f'{func1_str} = 0', 
+                color=LINE1_COLOR, linewidth=2)
+        ax.plot(*segments_to_polyline(segments2), label=f'{func2_str} = 0', 
+                color=LINE2_COLOR, linewidth=2)
+        
+        for x_pt, y_pt in points or []:
+            ax.plot(x_pt, y_pt, 'o', color=SOLUTION_COLOR, markersize=8, 
+                   zorder=3)
+            annotate_solution(ax, x_pt, y_pt)
+        
+        style_legend(ax)
+        ax.set_aspect('equal', adjustable='datalim')
+        
         self.figure.tight_layout()
         self.canvas.draw()
\ No newline at end of file
@@ -0,0 +1,202 @@
+import json
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from contextlib import contextmanager
+
+import numpy as np
+from PySide2.QtCore import QObject, QTimer, Qt
+from PySide2.QtWidgets import QLabel
+
+HEARTBEAT_INTERVAL_MS = 50
+STALL_THRESHOLD_MS = 250
+LATENCY_HISTORY = 512
+STALL_HISTORY = 64
+OVERLAY_REFRESH_MS = 500
+
+
+class EventLoopWatchdog(QObject):
+    """
+    Detect event-loop stalls and record per-interaction latencies.
+
+    A QTimer heartbeat runs on the GUI thread; a monitor thread notices
+    when it stops firing for longer than the threshold and captures the
+    GUI thread's Python stack at that moment.
+    """
+
+    def __init__(self, parent=None, interval_ms=HEARTBEAT_INTERVAL_MS,
+                 threshold_ms=STALL_THRESHOLD_MS):
+        super().__init__(parent)
+        self.interval_ms = interval_ms
+        self.threshold_ms = threshold_ms
+        self.latencies = deque(maxlen=LATENCY_HISTORY)
+        self.stalls = deque(maxlen=STALL_HISTORY)
+
+        self._lock = threading.Lock()
+        self._gui_thread_id = threading.get_ident()
+        self._last_beat = time.monotonic()
+        self._current_stall = None
+        self._pending = {}
+        self._stop_event = threading.Event()
+        self._monitor = None
+
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self._beat)
+
+    def start(self):
+        """Start the heartbeat and the monitor thread."""
+        self._last_beat = time.monotonic()
+        self._stop_event.clear()
+        self._timer.start(self.interval_ms)
+        self._monitor = threading.Thread(target=self._watch, name='event-loop-watchdog',
+                                         daemon=True)
+        self._monitor.start()
+
+    def stop(self):
+        """Stop the heartbeat and the monitor thread."""
+        self._timer.stop()
+        self._stop_event.set()
+        if self._monitor is not None:
+            self._monitor.join()
+            self._monitor = None
+
+    def _beat(self):
+        now = time.monotonic()
+        with self._lock:
+            if self._current_stall is not None:
+                self._current_stall['duration_ms'] = (now - self._last_beat) * 1000
+                self._current_stall = None
+            self._last_beat = now
+
+    def _watch(self):
+        while not self._stop_event.wait(self.interval_ms / 1000):
+            with self._lock:
+                blocked_ms = (time.monotonic() - self._last_beat) * 1000
+                if blocked_ms < self.threshold_ms or self._current_stall is not None:
+                    continue
+
+                frame = sys._current_frames().get(self._gui_thread_id)
+                stack = ''.join(traceback.format_stack(frame)) if frame else ''
+                self._current_stall = {
+                    'time': time.time() - blocked_ms / 1000,
+                    'duration_ms': blocked_ms,
+                    'stack': stack,
+                }
+                self.stalls.append(self._current_stall)
+
+    def begin(self, name):
+        """Mark the start of an interaction."""
+        self._pending[name] = time.perf_counter()
+
+    def end(self, name):
+        """Record the latency of an interaction started with begin()."""
+        start = self._pending.pop(name, None)
+        if start is not None:
+            self.record(name, (time.perf_counter() - start) * 1000)
+
+    def record(self, name, latency_ms):
+        self.latencies.append((name, latency_ms, time.time()))
+
+    @contextmanager
+    def measure(self, name):
+        """Record the latency of the enclosed block."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, (time.perf_counter() - start) * 1000)
+
+    def watch_keystrokes(self, line_edit, name='keystroke-to-idle'):
+        """
+        Record the time from an edit until the event loop is idle again.
+
+        Previews are not redrawn on every keystroke, so this measures the
+        work the edit itself triggers (line-edit repaint and any queued
+        events) rather than a downstream update.
+        """
+        def on_edit(_):
+            self.begin(name)
+            QTimer.singleShot(0, lambda: self.end(name))
+        line_edit.textEdited.connect(on_edit)
+
+    def summary(self):
+        """Return count, p50, p95 and max latency in ms per interaction."""
+        by_name = {}
+        for name, latency_ms, _ in list(self.latencies):
+            by_name.setdefault(name, []).append(latency_ms)
+
+        result = {}
+        for name, values in by_name.items():
+            p50, p95 = np.percentile(values, [50, 95])
+            result[name] = {'count': len(values), 'p50_ms': float(p50),
+                            'p95_ms': float(p95), 'max_ms': float(max(values))}
+        return result
+
+    def dump(self, path=None):
+        """
+        Return all telemetry as a dict, also writing it as JSON to path.
+        """
+        with self._lock:
+            stalls = [dict(stall) for stall in self.stalls]
+        data = {
+            'summary': self.summary(),
+            'latencies': [{'name': name, 'latency_ms': latency_ms, 'time': t}
+                          for name, latency_ms, t in list(self.latencies)],
+            'stalls': stalls,
+        }
+        if path is not None:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(path, 'w') as f:
+                json.dump(data, f, indent=2)
+        return data
+
+
+class TelemetryOverlay(QLabel):
+    """Developer overlay showing latency percentiles and recent stalls."""
+
+    def __init__(self, watchdog, parent):
+        super().__init__(parent)
+        self.watchdog = watchdog
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self.setStyleSheet("""
+            QLabel {
+                background-color: rgba(26, 26, 26, 200);
+                color: #e0e0e0;
+                border-radius: 6px;
+                padding: 8px;
+                font-family: 'Consolas';
+                font-size: 11px;
+            }
+        """)
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self.refresh)
+        self.hide()
+
+    def toggle(self):
+        """Show or hide the overlay."""
+        if self.isVisible():
+            self._timer.stop()
+            self.hide()
+        else:
+            self.refresh()
+            self.show()
+            self.raise_()
+            self._timer.start(OVERLAY_REFRESH_MS)
+
+    def refresh(self):
+        lines = []
+        for name, stats in self.watchdog.summary().items():
+            lines.append(f"{name}: n={stats['count']} p50={stats['p50_ms']:.1f}ms "
+                         f"p95={stats['p95_ms']:.1f}ms max={stats['max_ms']:.1f}ms")
+        stalls = list(self.watchdog.stalls)
+        lines.append(f"stalls > {self.watchdog.threshold_ms}ms: {len(stalls)}")
+        if stalls:
+            lines.append(f"last stall: {stalls[-1]['duration_ms']:.0f}ms")
+        self.setText('\n'.join(lines))
+        self.adjustSize()
+        self.move(10, 10)
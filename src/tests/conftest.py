@@ -4,6 +4,7 @@ from gui.main_window import MainWindow
 from gui.input_panel import InputPanel
 from core.equation_solver import EquationSolver
 from core.expression_parser import ExpressionParser
+from core.implicit_solver import ImplicitSolver
 from PySide2.QtCore import Qt
 
 @pytest.fixture(scope="session")
@@ -12,9 +13,9 @@ def app():
     return QApplication.instance() or QApplication([])
 
 @pytest.fixture
-def main_window(app, qtbot):
-    """Create the main window instance"""
-    window = MainWindow()
+def main_window(app, qtbot, tmp_path):
+    """Create the main window instance with history kept in tmp_path"""
+    window = MainWindow(history_path=tmp_path / "history.npz")
     qtbot.addWidget(window)
     return window
 
@@ -30,6 +31,11 @@ def solver():
     """Create equation solver instance"""
     return EquationSolver()
 
+@pytest.fixture
+def implicit_solver():
+    """Create implicit curve solver instance"""
+    return ImplicitSolver()
+
 @pytest.fixture
 def parser():
     """Create expression parser instance"""
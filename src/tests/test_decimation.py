@@ -0,0 +1,50 @@
+import pytest
+import numpy as np
+from core.decimation import decimate_minmax, minmax_indices
+
+@pytest.mark.plot
+class TestDecimation:
+    def test_short_curve_unchanged(self):
+        """Test curves already below the pixel budget pass through"""
+        x_vals = np.linspace(-10, 10, 100)
+        y_vals = x_vals ** 2
+        x_out, y_out = decimate_minmax(x_vals, y_vals, 800)
+        assert np.array_equal(x_out, x_vals)
+        assert np.array_equal(y_out, y_vals)
+
+    def test_output_bounded_by_pixel_width(self):
+        """Test decimated size is proportional to the pixel width"""
+        x_vals = np.linspace(-10, 10, 1_000_000)
+        y_vals = np.sin(50 * x_vals)
+        x_out, y_out = decimate_minmax(x_vals, y_vals, 800)
+        assert len(x_out) == len(y_out)
+        assert len(x_out) <= 2 * 800
+        assert np.all(np.diff(x_out) >= 0)
+
+    def test_peaks_preserved(self):
+        """Test narrow spikes survive decimation"""
+        x_vals = np.linspace(0, 1, 100_000)
+        y_vals = np.zeros_like(x_vals)
+        y_vals[12345] = 100
+        y_vals[67890] = -100
+        _, y_out = decimate_minmax(x_vals, y_vals, 500)
+        assert y_out.max() == 100
+        assert y_out.min() == -100
+
+    def test_nan_gaps_preserved(self):
+        """Test undefined regions still break the curve"""
+        x_vals = np.linspace(-10, 10, 100_000)
+        y_vals = np.where(x_vals > 0, np.log10(np.abs(x_vals)), np.nan)
+        x_out, y_out = decimate_minmax(x_vals, y_vals, 400)
+        assert np.isnan(y_out[x_out < -1]).all()
+        assert not np.isnan(y_out[x_out > 1]).any()
+
+    def test_every_column_has_real_samples(self):
+        """Test sizes just above the budget use every column without padding"""
+        x_vals = np.linspace(0, 1, 1601)
+        y_vals = np.sin(40 * x_vals)
+        idx = minmax_indices(y_vals, 800)
+        assert len(np.unique(idx)) == len(idx)
+        assert np.all(np.diff(idx) > 0)
+        assert 800 <= len(idx) <= 1600
+        assert idx[-1] < len(y_vals)
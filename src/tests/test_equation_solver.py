@@ -39,4 +39,113 @@ class TestEquationSolver:
         assert len(x_vals) == len(y1_vals) == len(y2_vals)
         assert isinstance(solutions, list)
         assert func1_str == "x**2"
-        assert func2_str == "4"
\ No newline at end of file
+        assert func2_str == "4"
+
+    def test_warm_start_on_coefficient_edit(self, solver):
+        """Test coefficient edits are re-solved numerically"""
+        solver.solve_functions("2x^2+3x-5", "0")
+        assert solver.state.method == 'symbolic'
+        
+        solutions, _ = solver.solve_functions("2x^2+3.1x-5", "0")
+        assert solver.state.method == 'numeric'
+        assert solver.state.verified
+        expected = np.roots([2, 3.1, -5])
+        assert np.allclose(sorted(solutions), sorted(expected), atol=1e-9)
+
+    def test_warm_start_roots_disappear(self, solver):
+        """Test roots that vanish after an edit are dropped"""
+        solver.solve_functions("x^2+1", "2")
+        solutions, _ = solver.solve_functions("x^2+1", "0.5")
+        assert solver.state.method == 'numeric'
+        assert solutions is None
+
+    def test_warm_start_roots_appear(self, solver):
+        """Test roots that appear after an edit are found by the scan"""
+        solver.solve_functions("x^3-3x", "4")
+        solutions, _ = solver.solve_functions("x^3-3x", "1")
+        assert solver.state.method == 'numeric'
+        assert len(solutions) == 3
+
+    def test_warm_start_roots_outside_previous_window(self, solver):
+        """Test the scan covers roots far outside the previous solutions"""
+        solver.solve_functions("x^2-3x", "0")
+        solutions, _ = solver.solve_functions("x^2-30x", "0")
+        assert solver.state.method == 'numeric'
+        assert solver.state.verified
+        assert np.allclose(solutions, [0, 30], atol=1e-9)
+
+    def test_warm_start_near_double_roots(self, solver):
+        """Test roots closer than the scan spacing match a cold solve"""
+        cold, _ = EquationSolver().solve_functions("x^2-1000.1x+250050", "0")
+        solver.solve_functions("x^2-3x+2", "0")
+        warm, _ = solver.solve_functions("x^2-1000.1x+250050", "0")
+        assert solver.state.verified
+        assert len(warm) == len(cold) == 2
+        assert np.allclose(warm, cold, rtol=1e-9)
+
+    def test_unbounded_roots_resolve_symbolically(self, solver):
+        """Test coefficient edits of non-polynomial equations fall back to sympy"""
+        solver.solve_functions("1/x", "1")
+        solutions, _ = solver.solve_functions("1/x", "0.001")
+        assert solver.state.method == 'symbolic'
+        assert abs(solutions[0] - 1000) < 1e-6
+
+    def test_structural_edit_resolves_symbolically(self, solver):
+        """Test edits beyond coefficients fall back to sympy"""
+        solver.solve_functions("x^2", "4")
+        solutions, _ = solver.solve_functions("x^3", "8")
+        assert solver.state.method == 'symbolic'
+        assert abs(solutions[0] - 2) < 1e-6
+
+    def test_analysis_extrema_and_inflections(self, solver):
+        """Test critical and inflection points of a cubic"""
+        _, _, analysis = solver.analyze_functions("x^3-3x", "x")
+        extrema = sorted(analysis['extrema'])
+        assert [kind for _, _, kind, _ in extrema] == ['max', 'min']
+        assert abs(extrema[0][0] + 1) < 1e-9 and abs(extrema[0][1] - 2) < 1e-9
+        assert abs(extrema[1][0] - 1) < 1e-9 and abs(extrema[1][1] + 2) < 1e-9
+        assert len(analysis['inflections']) == 1
+        assert abs(analysis['inflections'][0][0]) < 1e-9
+
+    def test_analysis_areas(self, solver):
+        """Test areas between consecutive intersections"""
+        _, _, analysis = solver.analyze_functions("x^3-3x", "x")
+        areas = analysis['areas']
+        assert len(areas) == 2
+        for a, b, area in areas:
+            assert abs(area - 4) < 1e-8
+
+    def test_analysis_flat_minimum(self, solver):
+        """Test a stationary point with zero curvature is still an extremum"""
+        _, _, analysis = solver.analyze_functions("x^4", "1")
+        assert [(kind, curve) for _, _, kind, curve in analysis['extrema']] == [('min', 1)]
+        assert abs(analysis['extrema'][0][0]) < 1e-9
+        assert analysis['inflections'] == []
+
+    def test_analysis_flat_maximum(self, solver):
+        """Test extrema are classified by the slope on either side"""
+        _, _, analysis = solver.analyze_functions("-x^4", "-1")
+        assert [(kind, curve) for _, _, kind, curve in analysis['extrema']] == [('max', 1)]
+        assert analysis['inflections'] == []
+
+    def test_analysis_linear_has_no_extrema(self, solver):
+        """Test linear functions have no extrema or inflection points"""
+        _, _, analysis = solver.analyze_functions("2*x + 1", "x - 1")
+        assert analysis == {'extrema': [], 'inflections': [], 'areas': []}
+
+    def test_integrate(self, solver):
+        """Test vectorized adaptive quadrature"""
+        integrals = solver.integrate(np.sqrt, [0, 1], [1, 4])
+        assert np.allclose(integrals, [2 / 3, 14 / 3], atol=1e-8)
+
+    def test_integrate_large_values(self, solver):
+        """Test large integrands converge to a relative tolerance"""
+        integrals = solver.integrate(np.exp, [0], [20])
+        assert np.allclose(integrals, [np.exp(20) - 1], rtol=1e-9)
+
+    def test_analysis_area_across_pole(self, solver):
+        """Test intervals spanning a pole off the sample nodes report no area"""
+        solutions, _, analysis = solver.analyze_functions("1/(x-0.3)", "x")
+        assert len(solutions) == 2
+        assert analysis['areas'] == []
+        assert np.isnan(solver.integrate(lambda x: 1 / (x - 0.3), [-1], [1]))[0]
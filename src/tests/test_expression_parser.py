@@ -10,6 +10,7 @@ class TestExpressionParser:
             "x^2 - 4*x + 4",
             "x + 1",
             "(x + 1)*(x - 1)",
+            "x^2 + y^2 - 25",
         ]
         for expr in valid_exprs:
             is_valid, _ = parser.validate_expression(expr)
@@ -58,6 +59,8 @@ class TestExpressionParser:
             ("(x+1)(x-1)", "(x+1)*(x-1)"),
             ("2(x+1)", "2*(x+1)"),
             ("x(x+1)", "x*(x+1)"),
+            ("2xy", "2*x*y"),
+            ("y(x+1)", "y*(x+1)"),
         ]
         for input_expr, expected in test_cases:
             formatted = parser.format_expression(input_expr)
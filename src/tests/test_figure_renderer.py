@@ -0,0 +1,44 @@
+import pytest
+from core import figure_renderer
+from core.figure_renderer import FigureRenderer, render_batch
+
+@pytest.mark.plot
+class TestFigureRenderer:
+    def test_render_png_bytes(self, solver):
+        """Test rendering plot data to an in-memory PNG"""
+        renderer = FigureRenderer()
+        _, plot_data = solver.solve_functions("x^2", "4")
+        data = renderer.render(plot_data)
+        assert data.startswith(b'\x89PNG')
+
+    def test_render_svg_file(self, solver, tmp_path):
+        """Test rendering plot data to an SVG file"""
+        renderer = FigureRenderer()
+        _, plot_data = solver.solve_functions("2*x + 1", "x - 1")
+        path = renderer.render(plot_data, tmp_path / "plot.svg", fmt='svg')
+        assert path.read_text().lstrip().startswith('<?xml')
+
+    def test_artists_reused(self, solver):
+        """Test consecutive renders update the same figure in place"""
+        renderer = FigureRenderer()
+        line1 = renderer.line1
+        renderer.render(solver.solve_functions("x^2", "4")[1])
+        renderer.render(solver.solve_functions("2*x + 1", "x - 1")[1])
+        assert renderer.line1 is line1
+        assert len(renderer.annotations) == 1
+        assert len(renderer.ax.lines) == 3
+
+    def test_render_batch(self, tmp_path):
+        """Test rendering several pairs over the worker pool"""
+        pairs = [("x^2", "4"), ("2*x + 1", "x - 1")]
+        results, rate = render_batch(pairs, output_dir=tmp_path, workers=2)
+        assert len(results) == 2
+        assert all((tmp_path / f"figure_{i:05d}.png").exists() for i in range(2))
+        assert rate > 0
+
+    def test_worker_tasks_independent(self):
+        """Test batch tasks never warm-start from a previous pair"""
+        figure_renderer._init_worker((8, 6), 100)
+        figure_renderer._render_task(("x^2", "4", None, 'png'))
+        figure_renderer._render_task(("x^2", "9", None, 'png'))
+        assert figure_renderer._worker_solver.state.method == 'symbolic'
@@ -0,0 +1,56 @@
+import pytest
+import numpy as np
+from core.implicit_solver import ImplicitSolver
+
+@pytest.mark.solver
+class TestImplicitSolver:
+    def test_circle_trace(self, implicit_solver):
+        """Test traced circle segments lie on the curve"""
+        segments = implicit_solver.trace_curve("x^2 + y^2 - 25")
+        assert segments.shape[1:] == (2, 2)
+        radii = np.hypot(segments[..., 0], segments[..., 1])
+        assert np.abs(radii - 5).max() < 1e-4
+
+    def test_no_curve(self, implicit_solver):
+        """Test relations with no zero set produce no segments"""
+        segments = implicit_solver.trace_curve("x^2 + y^2 + 1")
+        assert len(segments) == 0
+
+    def test_pole_not_traced(self, implicit_solver):
+        """Test sign changes across a pole are not drawn as curve"""
+        segments = implicit_solver.trace_curve("x*y - 1")
+        assert np.abs(segments[..., 0]).min() > 0.05
+
+    def test_circle_line_intersections(self, implicit_solver):
+        """Test intersections of a circle and a line"""
+        points = implicit_solver.find_intersections("x^2 + y^2 - 25", "y - x")
+        assert len(points) == 2
+        r = 5 / np.sqrt(2)
+        assert np.allclose(points, [(-r, -r), (r, r)], atol=1e-8)
+
+    def test_circle_ellipse_intersections(self, implicit_solver):
+        """Test four intersections of two implicit curves"""
+        points = implicit_solver.find_intersections("x^2 + y^2 - 25",
+                                                    "x^2/4 + y^2 - 9")
+        assert len(points) == 4
+        for x, y in points:
+            assert abs(x**2 + y**2 - 25) < 1e-8
+            assert abs(x**2 / 4 + y**2 - 9) < 1e-8
+
+    def test_solve_implicit_no_intersections(self, implicit_solver):
+        """Test concentric circles have no intersections"""
+        points, plot_data = implicit_solver.solve_implicit("x^2 + y^2 - 1",
+                                                           "x^2 + y^2 - 25")
+        segments1, segments2, plot_points, func1_str, func2_str = plot_data
+        assert points is None
+        assert len(segments1) and len(segments2)
+        assert func1_str == "x**2 + y**2 - 1"
+
+    def test_solve_implicit_explicit_partner(self, implicit_solver):
+        """Test an input without y is read as the curve y = f(x)"""
+        points, plot_data = implicit_solver.solve_implicit("x^2", "x^2 + y^2 - 25")
+        assert len(points) == 2
+        for x, y in points:
+            assert abs(y - x**2) < 1e-8
+            assert abs(x**2 + y**2 - 25) < 1e-8
+        assert plot_data[3] == "y - (x**2)"
@@ -0,0 +1,75 @@
+import pytest
+import numpy as np
+from core.solve_history import SolveHistory
+
+@pytest.mark.solver
+class TestSolveHistory:
+    def test_add_and_recall(self, solver):
+        """Test entries store compact plot data and restore it"""
+        history = SolveHistory()
+        _, plot_data = solver.solve_functions("x^2", "4")
+        history.add("x^2", "4", plot_data, state=solver.state)
+        
+        entry = history.recall(("x^2", "4"))
+        x_vals, y1_vals, y2_vals, solutions, func1_str, func2_str = entry.plot_data()
+        assert x_vals.dtype == np.float32
+        assert len(x_vals) == len(y1_vals) == len(y2_vals)
+        assert solutions == [-2.0, 2.0]
+        assert (func1_str, func2_str) == ("x**2", "4")
+        assert entry.state is not solver.state
+
+    def test_memory_cap_evicts_oldest(self, solver):
+        """Test the least recently used entries are evicted over the cap"""
+        _, plot_data = solver.solve_functions("x^2", "4")
+        history = SolveHistory(max_bytes=3 * 12500)
+        for rhs in ("1", "2", "3", "4"):
+            history.add("x^2", rhs, plot_data)
+        
+        assert history.nbytes <= history.max_bytes
+        assert ("x^2", "1") not in history
+        assert next(iter(history)).key == ("x^2", "4")
+
+    def test_save_and_load(self, solver, implicit_solver, tmp_path):
+        """Test history survives a save/load round trip"""
+        history = SolveHistory()
+        _, plot_data = solver.solve_functions("x^2", "4")
+        history.add("x^2", "4", plot_data)
+        _, plot_data = implicit_solver.solve_implicit("x^2 + y^2 - 25", "y - x")
+        history.add("x^2 + y^2 - 25", "y - x", plot_data, implicit=True)
+        
+        path = tmp_path / "history.npz"
+        history.save(path)
+        loaded = SolveHistory.load(path)
+        
+        assert [e.key for e in loaded] == [e.key for e in history]
+        entry = loaded.recall(("x^2 + y^2 - 25", "y - x"))
+        assert entry.implicit
+        assert len(entry.solutions) == 2
+        assert isinstance(entry.solutions[0], tuple)
+
+    def test_analysis_round_trip(self, solver, tmp_path):
+        """Test analysis results are stored and restored with the entry"""
+        history = SolveHistory()
+        _, plot_data, analysis = solver.analyze_functions("x^3-3x", "x")
+        history.add("x^3-3x", "x", plot_data, analysis=analysis)
+        
+        path = tmp_path / "history.npz"
+        history.save(path)
+        entry = SolveHistory.load(path).recall(("x^3-3x", "x"))
+        assert entry.analysis == analysis
+        
+    def test_load_missing_file(self, tmp_path):
+        """Test loading a missing history file gives an empty history"""
+        assert len(SolveHistory.load(tmp_path / "missing.npz")) == 0
+
+    def test_load_truncated_file(self, solver, tmp_path):
+        """Test a truncated history file gives an empty history"""
+        history = SolveHistory()
+        _, plot_data = solver.solve_functions("x^2", "4")
+        history.add("x^2", "4", plot_data)
+        path = tmp_path / "history.npz"
+        history.save(path)
+        assert [p.name for p in tmp_path.iterdir()] == ["history.npz"]
+        
+        path.write_bytes(path.read_bytes()[:100])
+        assert len(SolveHistory.load(path)) == 0
@@ -0,0 +1,52 @@
+import time
+import pytest
+from gui.watchdog import EventLoopWatchdog, LATENCY_HISTORY
+
+@pytest.fixture
+def watchdog(app):
+    """Create a running event-loop watchdog"""
+    dog = EventLoopWatchdog(interval_ms=20, threshold_ms=100)
+    dog.start()
+    yield dog
+    dog.stop()
+
+@pytest.mark.gui
+class TestEventLoopWatchdog:
+    def test_stall_detected_with_stack(self, watchdog, qtbot):
+        """Test a blocked GUI thread is reported with its stack"""
+        qtbot.wait(50)
+        time.sleep(0.3)
+        qtbot.wait(100)
+        
+        # Other stalls (e.g. on a loaded CI machine) may be recorded too
+        stalls = [stall for stall in watchdog.stalls
+                  if 'test_stall_detected_with_stack' in stall['stack']]
+        assert len(stalls) == 1
+        assert stalls[0]['duration_ms'] >= watchdog.threshold_ms
+
+    def test_no_stall_when_idle(self, watchdog, qtbot):
+        """Test an idle event loop reports no stalls"""
+        qtbot.wait(300)
+        assert len(watchdog.stalls) == 0
+
+    def test_latency_ring_buffer(self, watchdog):
+        """Test interaction latencies are kept in a bounded buffer"""
+        for _ in range(LATENCY_HISTORY + 10):
+            with watchdog.measure('click-to-plot'):
+                pass
+        watchdog.begin('keystroke-to-idle')
+        watchdog.end('keystroke-to-idle')
+        
+        assert len(watchdog.latencies) == LATENCY_HISTORY
+        summary = watchdog.summary()
+        assert summary['keystroke-to-idle']['count'] == 1
+        assert summary['click-to-plot']['count'] == LATENCY_HISTORY - 1
+
+    def test_dump(self, watchdog, tmp_path):
+        """Test telemetry can be dumped to JSON"""
+        watchdog.record('solve', 12.5)
+        path = tmp_path / "telemetry.json"
+        data = watchdog.dump(path)
+        assert path.exists()
+        assert data['latencies'][0]['latency_ms'] == 12.5
+        assert data['stalls'] == []